@@ -6,12 +6,14 @@ from collections import deque
 from collections.abc import Iterable, Iterator, KeysView, MutableMapping
 from types import MappingProxyType
 from typing import Any
+from weakref import WeakKeyDictionary
 
 from itemadapter._imports import _scrapy_item_classes, attr
 from itemadapter.utils import (
     _get_pydantic_model_metadata,
     _get_pydantic_v1_model_metadata,
     _is_attrs_class,
+    _is_pydantic_instance,
     _is_pydantic_model,
     _is_pydantic_v1_model,
 )
@@ -27,16 +29,47 @@ __all__ = [
 ]
 
 
+# builtin types that can never be attrs or dataclass items, rejected before introspection
+_NON_ITEM_TYPES = frozenset([bool, int, float, str, bytes, list, tuple, set, dict, type(None)])
+
+# field mappings per attrs/dataclass item class, which cannot change once the class is created
+_ATTRS_FIELDS: WeakKeyDictionary = WeakKeyDictionary()
+_DATACLASS_FIELDS: WeakKeyDictionary = WeakKeyDictionary()
+
+
+def _get_attrs_fields_dict(item_class: type) -> dict:
+    fields_dict = _ATTRS_FIELDS.get(item_class)
+    if fields_dict is None:
+        fields_dict = _ATTRS_FIELDS[item_class] = attr.fields_dict(item_class)
+    return fields_dict
+
+
+def _get_dataclass_fields_dict(item_class: type) -> dict:
+    fields_dict = _DATACLASS_FIELDS.get(item_class)
+    if fields_dict is None:
+        fields_dict = _DATACLASS_FIELDS[item_class] = {
+            field.name: field for field in dataclasses.fields(item_class)
+        }
+    return fields_dict
+
+
 class AdapterInterface(MutableMapping, metaclass=ABCMeta):
     """Abstract Base Class for adapters.
 
     An adapter that handles a specific type of item should inherit from this
     class and implement the abstract methods defined here, plus the
     abtract methods inherited from the MutableMapping base class.
+
+    Subclasses that declare ``__slots__`` must include ``"item"`` in them.
     """
 
+    __slots__ = ()
+
     def __init__(self, item: Any) -> None:
-        self.item = item
+        # AdapterInterface has no "item" slot, to avoid layout conflicts in subclasses. The
+        # built-in adapters declare that slot; other subclasses keep item in their __dict__,
+        # so subclasses that declare __slots__ must include "item" (or "__dict__") in them.
+        self.item = item  # pylint: disable=assigning-non-slot
 
     @classmethod
     @abstractmethod
@@ -69,6 +102,8 @@ class AdapterInterface(MutableMapping, metaclass=ABCMeta):
 
 
 class _MixinAttrsDataclassAdapter:
+    __slots__ = ()
+
     _fields_dict: dict
     item: Any
 
@@ -109,16 +144,20 @@ class _MixinAttrsDataclassAdapter:
 
 
 class AttrsAdapter(_MixinAttrsDataclassAdapter, AdapterInterface):
+    __slots__ = ("item", "_fields_dict")
+
     def __init__(self, item: Any) -> None:
         super().__init__(item)
         if attr is None:
             raise RuntimeError("attr module is not available")
         # store a reference to the item's fields to avoid O(n) lookups and O(n^2) traversals
-        self._fields_dict = attr.fields_dict(self.item.__class__)
+        self._fields_dict = _get_attrs_fields_dict(self.item.__class__)
 
     @classmethod
     def is_item(cls, item: Any) -> bool:
-        return _is_attrs_class(item) and not isinstance(item, type)
+        if isinstance(item, type) or type(item) in _NON_ITEM_TYPES:
+            return False
+        return _is_attrs_class(item)
 
     @classmethod
     def is_item_class(cls, item_class: type) -> bool:
@@ -129,7 +168,7 @@ class AttrsAdapter(_MixinAttrsDataclassAdapter, AdapterInterface):
         if attr is None:
             raise RuntimeError("attr module is not available")
         try:
-            return attr.fields_dict(item_class)[field_name].metadata  # type: ignore
+            return _get_attrs_fields_dict(item_class)[field_name].metadata
         except KeyError:
             raise KeyError(f"{item_class.__name__} does not support field: {field_name}")
 
@@ -137,18 +176,22 @@ class AttrsAdapter(_MixinAttrsDataclassAdapter, AdapterInterface):
     def get_field_names_from_class(cls, item_class: type) -> list[str] | None:
         if attr is None:
             raise RuntimeError("attr module is not available")
-        return [a.name for a in attr.fields(item_class)]
+        return list(_get_attrs_fields_dict(item_class))
 
 
 class DataclassAdapter(_MixinAttrsDataclassAdapter, AdapterInterface):
+    __slots__ = ("item", "_fields_dict")
+
     def __init__(self, item: Any) -> None:
         super().__init__(item)
         # store a reference to the item's fields to avoid O(n) lookups and O(n^2) traversals
-        self._fields_dict = {field.name: field for field in dataclasses.fields(self.item)}
+        self._fields_dict = _get_dataclass_fields_dict(self.item.__class__)
 
     @classmethod
     def is_item(cls, item: Any) -> bool:
-        return dataclasses.is_dataclass(item) and not isinstance(item, type)
+        if isinstance(item, type) or type(item) in _NON_ITEM_TYPES:
+            return False
+        return dataclasses.is_dataclass(item)
 
     @classmethod
     def is_item_class(cls, item_class: type) -> bool:
@@ -156,23 +199,29 @@ class DataclassAdapter(_MixinAttrsDataclassAdapter, AdapterInterface):
 
     @classmethod
     def get_field_meta_from_class(cls, item_class: type, field_name: str) -> MappingProxyType:
-        for field in dataclasses.fields(item_class):
-            if field.name == field_name:
-                return field.metadata  # type: ignore
-        raise KeyError(f"{item_class.__name__} does not support field: {field_name}")
+        try:
+            return _get_dataclass_fields_dict(item_class)[field_name].metadata
+        except KeyError:
+            raise KeyError(f"{item_class.__name__} does not support field: {field_name}")
 
     @classmethod
     def get_field_names_from_class(cls, item_class: type) -> list[str] | None:
-        return [a.name for a in dataclasses.fields(item_class)]
+        return list(_get_dataclass_fields_dict(item_class))
 
 
 class PydanticAdapter(AdapterInterface):
+    __slots__ = ("item",)
+
     item: Any
 
     @classmethod
     def is_item_class(cls, item_class: type) -> bool:
         return _is_pydantic_model(item_class) or _is_pydantic_v1_model(item_class)
 
+    @classmethod
+    def is_item(cls, item: Any) -> bool:
+        return _is_pydantic_instance(item)
+
     @classmethod
     def get_field_meta_from_class(cls, item_class: type, field_name: str) -> MappingProxyType:
         try:
@@ -254,6 +303,8 @@ class PydanticAdapter(AdapterInterface):
 
 
 class _MixinDictScrapyItemAdapter:
+    __slots__ = ()
+
     _fields_dict: dict
     item: Any
 
@@ -274,6 +325,8 @@ class _MixinDictScrapyItemAdapter:
 
 
 class DictAdapter(_MixinDictScrapyItemAdapter, AdapterInterface):
+    __slots__ = ("item",)
+
     @classmethod
     def is_item(cls, item: Any) -> bool:
         return isinstance(item, dict)
@@ -287,6 +340,8 @@ class DictAdapter(_MixinDictScrapyItemAdapter, AdapterInterface):
 
 
 class ScrapyItemAdapter(_MixinDictScrapyItemAdapter, AdapterInterface):
+    __slots__ = ("item",)
+
     @classmethod
     def is_item(cls, item: Any) -> bool:
         return isinstance(item, _scrapy_item_classes)
@@ -312,6 +367,8 @@ class ItemAdapter(MutableMapping):
     to extract and set data without having to take the object's type into account.
     """
 
+    __slots__ = ("adapter", "__weakref__")
+
     ADAPTER_CLASSES: Iterable[type[AdapterInterface]] = deque(
         [
             ScrapyItemAdapter,
@@ -365,6 +422,17 @@ class ItemAdapter(MutableMapping):
     def item(self) -> Any:
         return self.adapter.item
 
+    def __getstate__(self) -> tuple:
+        # needed to pickle a class with __slots__ using protocols 0 and 1; the __dict__ of
+        # subclasses that do not define __slots__ is kept too
+        return self.item, getattr(self, "__dict__", None)
+
+    def __setstate__(self, state: tuple) -> None:
+        item, attributes = state
+        self.__init__(item)  # type: ignore[misc]
+        if attributes:
+            self.__dict__.update(attributes)
+
     def __repr__(self) -> str:
         values = ", ".join([f"{key}={value!r}" for key, value in self.items()])
         return f"<{self.__class__.__name__} for {self.item.__class__.__name__}({values})>"
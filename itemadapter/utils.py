@@ -26,6 +26,13 @@ def _is_pydantic_v1_model(obj: Any) -> bool:
     return issubclass(obj, pydantic_v1.BaseModel)
 
 
+def _is_pydantic_instance(obj: Any) -> bool:
+    """Return True if obj is a pydantic or pydantic.v1 model instance."""
+    return (pydantic is not None and isinstance(obj, pydantic.BaseModel)) or (
+        pydantic_v1 is not None and isinstance(obj, pydantic_v1.BaseModel)
+    )
+
+
 def _get_pydantic_model_metadata(item_model: Any, field_name: str) -> MappingProxyType:
     metadata = {}
     field = item_model.model_fields[field_name]
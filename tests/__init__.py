@@ -1,24 +1,13 @@
-import importlib
 import sys
 from collections.abc import Generator
 from contextlib import contextmanager
 from dataclasses import dataclass, field
-from typing import Callable, Optional
+from typing import Optional
 
 from itemadapter import ItemAdapter
 from itemadapter._imports import pydantic, pydantic_v1
 
 
-def make_mock_import(block_name: str) -> Callable:
-    def mock_import(name: str, *args, **kwargs):
-        """Prevent importing a specific module, let everything else pass."""
-        if name.split(".")[0] == block_name:
-            raise ImportError(name)
-        return importlib.__import__(name, *args, **kwargs)
-
-    return mock_import
-
-
 @contextmanager
 def clear_itemadapter_imports() -> Generator[None, None, None]:
     backup = {}
@@ -0,0 +1,23 @@
+import pytest
+
+from tests import PydanticModel, PydanticV1Model
+
+
+@pytest.fixture(scope="session")
+def pydantic_model_default():
+    return PydanticModel()
+
+
+@pytest.fixture(scope="session")
+def pydantic_model_populated():
+    return PydanticModel(name="asdf", value=1234)
+
+
+@pytest.fixture(scope="session")
+def pydantic_v1_model_default():
+    return PydanticV1Model.construct()
+
+
+@pytest.fixture(scope="session")
+def pydantic_v1_model_populated():
+    return PydanticV1Model.construct(name="asdf", value=1234)
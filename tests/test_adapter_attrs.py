@@ -1,7 +1,11 @@
-import unittest
+import re
+import sys
+from contextlib import nullcontext
 from types import MappingProxyType
-from unittest import mock
 
+import pytest
+
+from itemadapter.adapter import AttrsAdapter
 from itemadapter.utils import get_field_meta_from_class
 from tests import (
     AttrsItem,
@@ -11,77 +15,85 @@ from tests import (
     ScrapyItem,
     ScrapySubclassedItem,
     clear_itemadapter_imports,
-    make_mock_import,
 )
 
+_NOT_VALID_ITEM_RE = re.compile(r"tests\.AttrsItem'> is not a valid item class")
 
-class AttrsTestCase(unittest.TestCase):
-    def test_false(self):
-        from itemadapter.adapter import AttrsAdapter
-
-        self.assertFalse(AttrsAdapter.is_item(int))
-        self.assertFalse(AttrsAdapter.is_item(sum))
-        self.assertFalse(AttrsAdapter.is_item(1234))
-        self.assertFalse(AttrsAdapter.is_item(object()))
-        self.assertFalse(AttrsAdapter.is_item(DataClassItem()))
-        self.assertFalse(AttrsAdapter.is_item("a string"))
-        self.assertFalse(AttrsAdapter.is_item(b"some bytes"))
-        self.assertFalse(AttrsAdapter.is_item({"a": "dict"}))
-        self.assertFalse(AttrsAdapter.is_item(["a", "list"]))
-        self.assertFalse(AttrsAdapter.is_item(("a", "tuple")))
-        self.assertFalse(AttrsAdapter.is_item({"a", "set"}))
-        self.assertFalse(AttrsAdapter.is_item(AttrsItem))
-
-        if PydanticModel is not None:
-            self.assertFalse(AttrsAdapter.is_item(PydanticModel()))
-        if PydanticV1Model is not None:
-            self.assertFalse(AttrsAdapter.is_item(PydanticV1Model()))
+_requires_attrs = pytest.mark.skipif(not AttrsItem, reason="attrs module is not available")
 
-        try:
-            import scrapy  # noqa: F401  # pylint: disable=unused-import
-        except ImportError:
-            pass
-        else:
-            self.assertFalse(AttrsAdapter.is_item(ScrapyItem()))
-            self.assertFalse(AttrsAdapter.is_item(ScrapySubclassedItem()))
 
-    @unittest.skipIf(not AttrsItem, "attrs module is not available")
-    @mock.patch("builtins.__import__", make_mock_import("attr"))
-    def test_module_import_error(self):
-        with clear_itemadapter_imports():
-            from itemadapter.adapter import AttrsAdapter
+@pytest.mark.parametrize(
+    "item",
+    [
+        int,
+        sum,
+        1234,
+        object(),
+        DataClassItem(),
+        "a string",
+        b"some bytes",
+        {"a": "dict"},
+        ["a", "list"],
+        ("a", "tuple"),
+        {"a", "set"},
+        AttrsItem,
+        pytest.param(
+            PydanticModel() if PydanticModel else None,
+            marks=pytest.mark.skipif(not PydanticModel, reason="pydantic module is not available"),
+        ),
+        pytest.param(
+            PydanticV1Model() if PydanticV1Model else None,
+            marks=pytest.mark.skipif(
+                not PydanticV1Model, reason="pydantic.v1 module is not available"
+            ),
+        ),
+        pytest.param(
+            ScrapyItem() if ScrapyItem else None,
+            marks=pytest.mark.skipif(not ScrapyItem, reason="scrapy module is not available"),
+        ),
+        pytest.param(
+            ScrapySubclassedItem() if ScrapySubclassedItem else None,
+            marks=pytest.mark.skipif(
+                not ScrapySubclassedItem, reason="scrapy module is not available"
+            ),
+        ),
+    ],
+)
+def test_false(item):
+    assert not AttrsAdapter.is_item(item)
 
-            self.assertFalse(AttrsAdapter.is_item(AttrsItem(name="asdf", value=1234)))
-            with self.assertRaises(RuntimeError, msg="attr module is not available"):
-                AttrsAdapter(AttrsItem(name="asdf", value=1234))
-            with self.assertRaises(RuntimeError, msg="attr module is not available"):
-                AttrsAdapter.get_field_meta_from_class(AttrsItem, "name")
-            with self.assertRaises(RuntimeError, msg="attr module is not available"):
-                AttrsAdapter.get_field_names_from_class(AttrsItem)
-            with self.assertRaises(TypeError, msg="AttrsItem is not a valid item class"):
-                get_field_meta_from_class(AttrsItem, "name")
 
-    @unittest.skipIf(not AttrsItem, "attrs module is not available")
-    @mock.patch("itemadapter.utils.attr", None)
-    def test_module_not_available(self):
+@_requires_attrs
+@pytest.mark.parametrize("import_error", [True, False], ids=["import_error", "not_available"])
+def test_module_not_available(monkeypatch, import_error):
+    if import_error:
+        monkeypatch.setitem(sys.modules, "attr", None)
+        imports = clear_itemadapter_imports()
+    else:
+        monkeypatch.setattr("itemadapter.utils.attr", None)
+        monkeypatch.setattr("itemadapter.adapter.attr", None)
+        imports = nullcontext()
+    with imports:
+        # pylint: disable-next=reimported,redefined-outer-name
         from itemadapter.adapter import AttrsAdapter
 
-        self.assertFalse(AttrsAdapter.is_item(AttrsItem(name="asdf", value=1234)))
-        with self.assertRaises(TypeError, msg="AttrsItem is not a valid item class"):
+        assert not AttrsAdapter.is_item(AttrsItem(name="asdf", value=1234))
+        with pytest.raises(RuntimeError, match="attr module is not available"):
+            AttrsAdapter(AttrsItem(name="asdf", value=1234))
+        with pytest.raises(RuntimeError, match="attr module is not available"):
+            AttrsAdapter.get_field_meta_from_class(AttrsItem, "name")
+        with pytest.raises(RuntimeError, match="attr module is not available"):
+            AttrsAdapter.get_field_names_from_class(AttrsItem)
+        with pytest.raises(TypeError, match=_NOT_VALID_ITEM_RE):
             get_field_meta_from_class(AttrsItem, "name")
 
-    @unittest.skipIf(not AttrsItem, "attrs module is not available")
-    def test_true(self):
-        from itemadapter.adapter import AttrsAdapter
 
-        self.assertTrue(AttrsAdapter.is_item(AttrsItem()))
-        self.assertTrue(AttrsAdapter.is_item(AttrsItem(name="asdf", value=1234)))
-        # field metadata
-        self.assertEqual(
-            get_field_meta_from_class(AttrsItem, "name"), MappingProxyType({"serializer": str})
-        )
-        self.assertEqual(
-            get_field_meta_from_class(AttrsItem, "value"), MappingProxyType({"serializer": int})
-        )
-        with self.assertRaises(KeyError, msg="AttrsItem does not support field: non_existent"):
-            get_field_meta_from_class(AttrsItem, "non_existent")
+@_requires_attrs
+def test_true():
+    assert AttrsAdapter.is_item(AttrsItem())
+    assert AttrsAdapter.is_item(AttrsItem(name="asdf", value=1234))
+    # field metadata
+    assert get_field_meta_from_class(AttrsItem, "name") == MappingProxyType({"serializer": str})
+    assert get_field_meta_from_class(AttrsItem, "value") == MappingProxyType({"serializer": int})
+    with pytest.raises(KeyError, match="AttrsItem does not support field: non_existent"):
+        get_field_meta_from_class(AttrsItem, "non_existent")
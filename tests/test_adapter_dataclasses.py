@@ -1,6 +1,9 @@
+from dataclasses import dataclass
 from types import MappingProxyType
-from unittest import TestCase
 
+import pytest
+
+from itemadapter.adapter import DataclassAdapter
 from itemadapter.utils import get_field_meta_from_class
 from tests import (
     AttrsItem,
@@ -12,54 +15,66 @@ from tests import (
 )
 
 
-class DataclassTestCase(TestCase):
-    def test_false(self):
-        from itemadapter.adapter import DataclassAdapter
-
-        self.assertFalse(DataclassAdapter.is_item(int))
-        self.assertFalse(DataclassAdapter.is_item(sum))
-        self.assertFalse(DataclassAdapter.is_item(1234))
-        self.assertFalse(DataclassAdapter.is_item(object()))
-        self.assertFalse(DataclassAdapter.is_item("a string"))
-        self.assertFalse(DataclassAdapter.is_item(b"some bytes"))
-        self.assertFalse(DataclassAdapter.is_item({"a": "dict"}))
-        self.assertFalse(DataclassAdapter.is_item(["a", "list"]))
-        self.assertFalse(DataclassAdapter.is_item(("a", "tuple")))
-        self.assertFalse(DataclassAdapter.is_item({"a", "set"}))
-        self.assertFalse(DataclassAdapter.is_item(DataClassItem))
+@dataclass
+class DataClassListSubclass(list):
+    name: str = ""
 
-        try:
-            import attrs  # noqa: F401  # pylint: disable=unused-import
-        except ImportError:
-            pass
-        else:
-            self.assertFalse(DataclassAdapter.is_item(AttrsItem()))
 
-        if PydanticModel is not None:
-            self.assertFalse(DataclassAdapter.is_item(PydanticModel()))
-        if PydanticV1Model is not None:
-            self.assertFalse(DataclassAdapter.is_item(PydanticV1Model()))
-
-        try:
-            import scrapy  # noqa: F401  # pylint: disable=unused-import
-        except ImportError:
-            pass
-        else:
-            self.assertFalse(DataclassAdapter.is_item(ScrapyItem()))
-            self.assertFalse(DataclassAdapter.is_item(ScrapySubclassedItem()))
+@pytest.mark.parametrize(
+    "item",
+    [
+        int,
+        sum,
+        1234,
+        object(),
+        "a string",
+        b"some bytes",
+        {"a": "dict"},
+        ["a", "list"],
+        ("a", "tuple"),
+        {"a", "set"},
+        DataClassItem,
+        pytest.param(
+            AttrsItem() if AttrsItem else None,
+            marks=pytest.mark.skipif(not AttrsItem, reason="attrs module is not available"),
+        ),
+        pytest.param(
+            PydanticModel() if PydanticModel else None,
+            marks=pytest.mark.skipif(not PydanticModel, reason="pydantic module is not available"),
+        ),
+        pytest.param(
+            PydanticV1Model() if PydanticV1Model else None,
+            marks=pytest.mark.skipif(
+                not PydanticV1Model, reason="pydantic.v1 module is not available"
+            ),
+        ),
+        pytest.param(
+            ScrapyItem() if ScrapyItem else None,
+            marks=pytest.mark.skipif(not ScrapyItem, reason="scrapy module is not available"),
+        ),
+        pytest.param(
+            ScrapySubclassedItem() if ScrapySubclassedItem else None,
+            marks=pytest.mark.skipif(
+                not ScrapySubclassedItem, reason="scrapy module is not available"
+            ),
+        ),
+    ],
+)
+def test_false(item):
+    assert not DataclassAdapter.is_item(item)
 
-    def test_true(self):
-        from itemadapter.adapter import DataclassAdapter
 
-        self.assertTrue(DataclassAdapter.is_item(DataClassItem()))
-        self.assertTrue(DataclassAdapter.is_item(DataClassItem(name="asdf", value=1234)))
-        # field metadata
-        self.assertEqual(
-            get_field_meta_from_class(DataClassItem, "name"), MappingProxyType({"serializer": str})
-        )
-        self.assertEqual(
-            get_field_meta_from_class(DataClassItem, "value"),
-            MappingProxyType({"serializer": int}),
-        )
-        with self.assertRaises(KeyError, msg="DataClassItem does not support field: non_existent"):
-            get_field_meta_from_class(DataClassItem, "non_existent")
+def test_true():
+    assert DataclassAdapter.is_item(DataClassItem())
+    assert DataclassAdapter.is_item(DataClassItem(name="asdf", value=1234))
+    # dataclasses that subclass a builtin type are still items
+    assert DataclassAdapter.is_item(DataClassListSubclass(name="asdf"))
+    # field metadata
+    assert get_field_meta_from_class(DataClassItem, "name") == MappingProxyType(
+        {"serializer": str}
+    )
+    assert get_field_meta_from_class(DataClassItem, "value") == MappingProxyType(
+        {"serializer": int}
+    )
+    with pytest.raises(KeyError, match="DataClassItem does not support field: non_existent"):
+        get_field_meta_from_class(DataClassItem, "non_existent")
@@ -1,120 +1,139 @@
-import unittest
+import re
+import sys
+from contextlib import nullcontext
 from types import MappingProxyType
-from unittest import mock
 
+import pytest
+
+from itemadapter.adapter import PydanticAdapter
 from itemadapter.utils import get_field_meta_from_class
 from tests import (
     AttrsItem,
     DataClassItem,
     PydanticModel,
     PydanticSpecialCasesModel,
+    PydanticV1Model,
     ScrapyItem,
     ScrapySubclassedItem,
     clear_itemadapter_imports,
-    make_mock_import,
 )
 
+_requires_pydantic = pytest.mark.skipif(
+    not PydanticModel, reason="pydantic module is not available"
+)
 
-class PydanticTestCase(unittest.TestCase):
-    def test_false(self):
-        from itemadapter.adapter import PydanticAdapter
+_NOT_VALID_ITEM_RE = re.compile(r"tests\.PydanticModel'> is not a valid item class")
 
-        self.assertFalse(PydanticAdapter.is_item(int))
-        self.assertFalse(PydanticAdapter.is_item(sum))
-        self.assertFalse(PydanticAdapter.is_item(1234))
-        self.assertFalse(PydanticAdapter.is_item(object()))
-        self.assertFalse(PydanticAdapter.is_item(DataClassItem()))
-        self.assertFalse(PydanticAdapter.is_item("a string"))
-        self.assertFalse(PydanticAdapter.is_item(b"some bytes"))
-        self.assertFalse(PydanticAdapter.is_item({"a": "dict"}))
-        self.assertFalse(PydanticAdapter.is_item(["a", "list"]))
-        self.assertFalse(PydanticAdapter.is_item(("a", "tuple")))
-        self.assertFalse(PydanticAdapter.is_item({"a", "set"}))
-        self.assertFalse(PydanticAdapter.is_item(PydanticModel))
+if PydanticModel is None:
+    _NAME_META = _VALUE_META = _SPECIAL_CASES_META = None
+else:
+    from pydantic_core import PydanticUndefined
 
-        try:
-            import attrs  # noqa: F401  # pylint: disable=unused-import
-        except ImportError:
-            pass
-        else:
-            self.assertFalse(PydanticAdapter.is_item(AttrsItem()))
+    # expected field metadata, except for default_factory, which is a different lambda per field
+    _NAME_META = {
+        "default": PydanticUndefined,
+        "json_schema_extra": {"serializer": str},
+        "repr": True,
+    }
+    _VALUE_META = {
+        "default": PydanticUndefined,
+        "json_schema_extra": {"serializer": int},
+        "repr": True,
+    }
+    _SPECIAL_CASES_META = {
+        "default": PydanticUndefined,
+        "alias": "special_cases",
+        "alias_priority": 2,
+        "validation_alias": "special_cases",
+        "serialization_alias": "special_cases",
+        "frozen": True,
+        "repr": True,
+    }
 
-        try:
-            import scrapy  # noqa: F401  # pylint: disable=unused-import
-        except ImportError:
-            pass
-        else:
-            self.assertFalse(PydanticAdapter.is_item(ScrapyItem()))
-            self.assertFalse(PydanticAdapter.is_item(ScrapySubclassedItem()))
 
-    @unittest.skipIf(not PydanticModel, "pydantic <2 module is not available")
-    @mock.patch("builtins.__import__", make_mock_import("pydantic"))
-    def test_module_import_error(self):
-        with clear_itemadapter_imports():
-            from itemadapter.adapter import PydanticAdapter
+@pytest.mark.parametrize(
+    "item",
+    [
+        int,
+        sum,
+        1234,
+        object(),
+        DataClassItem(),
+        "a string",
+        b"some bytes",
+        {"a": "dict"},
+        ["a", "list"],
+        ("a", "tuple"),
+        {"a", "set"},
+        pytest.param(
+            PydanticModel,
+            marks=_requires_pydantic,
+        ),
+        pytest.param(
+            PydanticV1Model,
+            marks=pytest.mark.skipif(
+                not PydanticV1Model, reason="pydantic.v1 module is not available"
+            ),
+        ),
+        pytest.param(
+            AttrsItem() if AttrsItem else None,
+            marks=pytest.mark.skipif(not AttrsItem, reason="attrs module is not available"),
+        ),
+        pytest.param(
+            ScrapyItem() if ScrapyItem else None,
+            marks=pytest.mark.skipif(not ScrapyItem, reason="scrapy module is not available"),
+        ),
+        pytest.param(
+            ScrapySubclassedItem() if ScrapySubclassedItem else None,
+            marks=pytest.mark.skipif(
+                not ScrapySubclassedItem, reason="scrapy module is not available"
+            ),
+        ),
+    ],
+)
+def test_false(item):
+    assert not PydanticAdapter.is_item(item)
 
-            self.assertFalse(PydanticAdapter.is_item(PydanticModel(name="asdf", value=1234)))
-            with self.assertRaises(TypeError, msg="PydanticModel is not a valid item class"):
-                get_field_meta_from_class(PydanticModel, "name")
 
-    @unittest.skipIf(not PydanticModel, "pydantic module is not available")
-    @mock.patch("itemadapter.utils.pydantic", None)
-    @mock.patch("itemadapter.utils.pydantic_v1", None)
-    def test_module_not_available(self):
+@_requires_pydantic
+@pytest.mark.parametrize("import_error", [True, False], ids=["import_error", "not_available"])
+def test_module_not_available(monkeypatch, import_error):
+    if import_error:
+        monkeypatch.setitem(sys.modules, "pydantic", None)
+        monkeypatch.setitem(sys.modules, "pydantic.v1", None)
+        imports = clear_itemadapter_imports()
+    else:
+        monkeypatch.setattr("itemadapter.utils.pydantic", None)
+        monkeypatch.setattr("itemadapter.utils.pydantic_v1", None)
+        imports = nullcontext()
+    with imports:
+        # pylint: disable-next=reimported,redefined-outer-name
         from itemadapter.adapter import PydanticAdapter
 
-        self.assertFalse(PydanticAdapter.is_item(PydanticModel(name="asdf", value=1234)))
-        with self.assertRaises(TypeError, msg="PydanticModel is not a valid item class"):
+        assert not PydanticAdapter.is_item(PydanticModel.model_construct(name="asdf", value=1234))
+        with pytest.raises(TypeError, match=_NOT_VALID_ITEM_RE):
             get_field_meta_from_class(PydanticModel, "name")
 
-    @unittest.skipIf(not PydanticModel, "pydantic module is not available")
-    def test_true(self):
-        from pydantic_core import PydanticUndefined
 
-        from itemadapter.adapter import PydanticAdapter
+@_requires_pydantic
+def test_true(pydantic_model_default, pydantic_model_populated):
+    assert PydanticAdapter.is_item(pydantic_model_default)
+    assert PydanticAdapter.is_item(pydantic_model_populated)
 
-        self.assertTrue(PydanticAdapter.is_item(PydanticModel()))
-        self.assertTrue(PydanticAdapter.is_item(PydanticModel(name="asdf", value=1234)))
-        # field metadata
-        mapping_proxy_type = get_field_meta_from_class(PydanticModel, "name")
-        self.assertEqual(
-            mapping_proxy_type,
-            MappingProxyType(
-                {
-                    "default": PydanticUndefined,
-                    "default_factory": mapping_proxy_type["default_factory"],
-                    "json_schema_extra": {"serializer": str},
-                    "repr": True,
-                }
-            ),
-        )
-        mapping_proxy_type = get_field_meta_from_class(PydanticModel, "value")
-        self.assertEqual(
-            get_field_meta_from_class(PydanticModel, "value"),
-            MappingProxyType(
-                {
-                    "default": PydanticUndefined,
-                    "default_factory": mapping_proxy_type["default_factory"],
-                    "json_schema_extra": {"serializer": int},
-                    "repr": True,
-                }
-            ),
-        )
-        mapping_proxy_type = get_field_meta_from_class(PydanticSpecialCasesModel, "special_cases")
-        self.assertEqual(
-            mapping_proxy_type,
-            MappingProxyType(
-                {
-                    "default": PydanticUndefined,
-                    "default_factory": mapping_proxy_type["default_factory"],
-                    "alias": "special_cases",
-                    "alias_priority": 2,
-                    "validation_alias": "special_cases",
-                    "serialization_alias": "special_cases",
-                    "frozen": True,
-                    "repr": True,
-                }
-            ),
-        )
-        with self.assertRaises(KeyError, msg="PydanticModel does not support field: non_existent"):
-            get_field_meta_from_class(PydanticModel, "non_existent")
+
+@_requires_pydantic
+def test_field_meta():
+    mapping_proxy_type = get_field_meta_from_class(PydanticModel, "name")
+    assert mapping_proxy_type == MappingProxyType(
+        {**_NAME_META, "default_factory": mapping_proxy_type["default_factory"]}
+    )
+    mapping_proxy_type = get_field_meta_from_class(PydanticModel, "value")
+    assert mapping_proxy_type == MappingProxyType(
+        {**_VALUE_META, "default_factory": mapping_proxy_type["default_factory"]}
+    )
+    mapping_proxy_type = get_field_meta_from_class(PydanticSpecialCasesModel, "special_cases")
+    assert mapping_proxy_type == MappingProxyType(
+        {**_SPECIAL_CASES_META, "default_factory": mapping_proxy_type["default_factory"]}
+    )
+    with pytest.raises(KeyError, match="PydanticModel does not support field: non_existent"):
+        get_field_meta_from_class(PydanticModel, "non_existent")
@@ -1,7 +1,11 @@
-import unittest
+import re
+import sys
+from contextlib import nullcontext
 from types import MappingProxyType
-from unittest import mock
 
+import pytest
+
+from itemadapter.adapter import PydanticAdapter
 from itemadapter.utils import get_field_meta_from_class
 from tests import (
     AttrsItem,
@@ -11,82 +15,98 @@ from tests import (
     ScrapyItem,
     ScrapySubclassedItem,
     clear_itemadapter_imports,
-    make_mock_import,
 )
 
+_requires_pydantic_v1 = pytest.mark.skipif(
+    not PydanticV1Model, reason="pydantic.v1 module is not available"
+)
 
-class PydanticTestCase(unittest.TestCase):
-    def test_false(self):
-        from itemadapter.adapter import PydanticAdapter
-
-        self.assertFalse(PydanticAdapter.is_item(int))
-        self.assertFalse(PydanticAdapter.is_item(sum))
-        self.assertFalse(PydanticAdapter.is_item(1234))
-        self.assertFalse(PydanticAdapter.is_item(object()))
-        self.assertFalse(PydanticAdapter.is_item(DataClassItem()))
-        self.assertFalse(PydanticAdapter.is_item("a string"))
-        self.assertFalse(PydanticAdapter.is_item(b"some bytes"))
-        self.assertFalse(PydanticAdapter.is_item({"a": "dict"}))
-        self.assertFalse(PydanticAdapter.is_item(["a", "list"]))
-        self.assertFalse(PydanticAdapter.is_item(("a", "tuple")))
-        self.assertFalse(PydanticAdapter.is_item({"a", "set"}))
-        self.assertFalse(PydanticAdapter.is_item(PydanticV1Model))
-
-        try:
-            import attrs  # noqa: F401  # pylint: disable=unused-import
-        except ImportError:
-            pass
-        else:
-            self.assertFalse(PydanticAdapter.is_item(AttrsItem()))
+_NOT_VALID_ITEM_RE = re.compile(r"tests\.PydanticV1Model'> is not a valid item class")
 
-        try:
-            import scrapy  # noqa: F401  # pylint: disable=unused-import
-        except ImportError:
-            pass
-        else:
-            self.assertFalse(PydanticAdapter.is_item(ScrapyItem()))
-            self.assertFalse(PydanticAdapter.is_item(ScrapySubclassedItem()))
 
-    @unittest.skipIf(not PydanticV1Model, "pydantic <2 module is not available")
-    @mock.patch("builtins.__import__", make_mock_import("pydantic"))
-    def test_module_import_error(self):
-        with clear_itemadapter_imports():
-            from itemadapter.adapter import PydanticAdapter
+@pytest.mark.parametrize(
+    "item",
+    [
+        int,
+        sum,
+        1234,
+        object(),
+        DataClassItem(),
+        "a string",
+        b"some bytes",
+        {"a": "dict"},
+        ["a", "list"],
+        ("a", "tuple"),
+        {"a", "set"},
+        pytest.param(
+            PydanticV1Model,
+            marks=_requires_pydantic_v1,
+        ),
+        pytest.param(
+            AttrsItem() if AttrsItem else None,
+            marks=pytest.mark.skipif(not AttrsItem, reason="attrs module is not available"),
+        ),
+        pytest.param(
+            ScrapyItem() if ScrapyItem else None,
+            marks=pytest.mark.skipif(not ScrapyItem, reason="scrapy module is not available"),
+        ),
+        pytest.param(
+            ScrapySubclassedItem() if ScrapySubclassedItem else None,
+            marks=pytest.mark.skipif(
+                not ScrapySubclassedItem, reason="scrapy module is not available"
+            ),
+        ),
+    ],
+)
+def test_false(item):
+    assert not PydanticAdapter.is_item(item)
 
-            self.assertFalse(PydanticAdapter.is_item(PydanticV1Model(name="asdf", value=1234)))
-            with self.assertRaises(TypeError, msg="PydanticV1Model is not a valid item class"):
-                get_field_meta_from_class(PydanticV1Model, "name")
 
-    @unittest.skipIf(not PydanticV1Model, "pydantic module is not available")
-    @mock.patch("itemadapter.utils.pydantic", None)
-    @mock.patch("itemadapter.utils.pydantic_v1", None)
-    def test_module_not_available(self):
+@_requires_pydantic_v1
+@pytest.mark.parametrize("import_error", [True, False], ids=["import_error", "not_available"])
+def test_module_not_available(monkeypatch, import_error):
+    if import_error:
+        monkeypatch.setitem(sys.modules, "pydantic", None)
+        monkeypatch.setitem(sys.modules, "pydantic.v1", None)
+        imports = clear_itemadapter_imports()
+    else:
+        monkeypatch.setattr("itemadapter.utils.pydantic", None)
+        monkeypatch.setattr("itemadapter.utils.pydantic_v1", None)
+        imports = nullcontext()
+    with imports:
+        # pylint: disable-next=reimported,redefined-outer-name
         from itemadapter.adapter import PydanticAdapter
 
-        self.assertFalse(PydanticAdapter.is_item(PydanticV1Model(name="asdf", value=1234)))
-        with self.assertRaises(TypeError, msg="PydanticV1Model is not a valid item class"):
+        assert not PydanticAdapter.is_item(PydanticV1Model(name="asdf", value=1234))
+        with pytest.raises(TypeError, match=_NOT_VALID_ITEM_RE):
             get_field_meta_from_class(PydanticV1Model, "name")
 
-    @unittest.skipIf(not PydanticV1Model, "pydantic module is not available")
-    def test_true(self):
-        from itemadapter.adapter import PydanticAdapter
 
-        self.assertTrue(PydanticAdapter.is_item(PydanticV1Model()))
-        self.assertTrue(PydanticAdapter.is_item(PydanticV1Model(name="asdf", value=1234)))
-        # field metadata
-        self.assertEqual(
-            get_field_meta_from_class(PydanticV1Model, "name"),
-            MappingProxyType({"serializer": str}),
-        )
-        self.assertEqual(
-            get_field_meta_from_class(PydanticV1Model, "value"),
-            MappingProxyType({"serializer": int}),
-        )
-        self.assertEqual(
-            get_field_meta_from_class(PydanticV1SpecialCasesModel, "special_cases"),
-            MappingProxyType({"alias": "special_cases", "allow_mutation": False}),
-        )
-        with self.assertRaises(
-            KeyError, msg="PydanticV1Model does not support field: non_existent"
-        ):
-            get_field_meta_from_class(PydanticV1Model, "non_existent")
+@_requires_pydantic_v1
+def test_true(pydantic_v1_model_default, pydantic_v1_model_populated):
+    assert PydanticAdapter.is_item(pydantic_v1_model_default)
+    assert PydanticAdapter.is_item(pydantic_v1_model_populated)
+
+
+@_requires_pydantic_v1
+@pytest.mark.parametrize(
+    ("model", "field_name", "expected"),
+    [
+        (PydanticV1Model, "name", {"serializer": str}),
+        (PydanticV1Model, "value", {"serializer": int}),
+        (
+            PydanticV1SpecialCasesModel,
+            "special_cases",
+            {"alias": "special_cases", "allow_mutation": False},
+        ),
+    ],
+    ids=["name", "value", "special_cases"],
+)
+def test_field_meta(model, field_name, expected):
+    assert get_field_meta_from_class(model, field_name) == MappingProxyType(expected)
+
+
+@_requires_pydantic_v1
+def test_field_meta_non_existent():
+    with pytest.raises(KeyError, match="PydanticV1Model does not support field: non_existent"):
+        get_field_meta_from_class(PydanticV1Model, "non_existent")
@@ -1,7 +1,12 @@
-import unittest
+import re
+import sys
+from contextlib import nullcontext
 from types import MappingProxyType
-from unittest import mock
 
+import pytest
+
+from itemadapter._imports import scrapy
+from itemadapter.adapter import ScrapyItemAdapter
 from itemadapter.utils import get_field_meta_from_class
 from tests import (
     AttrsItem,
@@ -11,130 +16,131 @@ from tests import (
     ScrapyItem,
     ScrapySubclassedItem,
     clear_itemadapter_imports,
-    make_mock_import,
 )
 
+_NOT_VALID_ITEM_RE = re.compile(r"tests\.ScrapySubclassedItem'> is not a valid item class")
+
+_NAME_META = MappingProxyType({"serializer": str})
+_VALUE_META = MappingProxyType({"serializer": int})
+
+_requires_scrapy = pytest.mark.skipif(
+    not ScrapySubclassedItem, reason="scrapy module is not available"
+)
 
-class ScrapyItemTestCase(unittest.TestCase):
-    def test_false(self):
-        from itemadapter.adapter import ScrapyItemAdapter
 
-        self.assertFalse(ScrapyItemAdapter.is_item(int))
-        self.assertFalse(ScrapyItemAdapter.is_item(sum))
-        self.assertFalse(ScrapyItemAdapter.is_item(1234))
-        self.assertFalse(ScrapyItemAdapter.is_item(object()))
-        self.assertFalse(ScrapyItemAdapter.is_item(DataClassItem()))
-        self.assertFalse(ScrapyItemAdapter.is_item("a string"))
-        self.assertFalse(ScrapyItemAdapter.is_item(b"some bytes"))
-        self.assertFalse(ScrapyItemAdapter.is_item({"a": "dict"}))
-        self.assertFalse(ScrapyItemAdapter.is_item(["a", "list"]))
-        self.assertFalse(ScrapyItemAdapter.is_item(("a", "tuple")))
-        self.assertFalse(ScrapyItemAdapter.is_item({"a", "set"}))
-        self.assertFalse(ScrapyItemAdapter.is_item(ScrapySubclassedItem))
-
-        try:
-            import attrs  # noqa: F401  # pylint: disable=unused-import
-        except ImportError:
-            pass
-        else:
-            self.assertFalse(ScrapyItemAdapter.is_item(AttrsItem()))
-
-        if PydanticModel is not None:
-            self.assertFalse(ScrapyItemAdapter.is_item(PydanticModel()))
-        if PydanticV1Model is not None:
-            self.assertFalse(ScrapyItemAdapter.is_item(PydanticV1Model()))
-
-    @unittest.skipIf(not ScrapySubclassedItem, "scrapy module is not available")
-    @mock.patch("builtins.__import__", make_mock_import("scrapy"))
-    def test_module_import_error(self):
-        with clear_itemadapter_imports():
-            from itemadapter.adapter import ScrapyItemAdapter
-
-            self.assertFalse(
-                ScrapyItemAdapter.is_item(ScrapySubclassedItem(name="asdf", value=1234))
-            )
-            with self.assertRaises(
-                TypeError, msg="ScrapySubclassedItem is not a valid item class"
-            ):
-                get_field_meta_from_class(ScrapySubclassedItem, "name")
-
-    @unittest.skipIf(not ScrapySubclassedItem, "scrapy module is not available")
-    @mock.patch("itemadapter.adapter._scrapy_item_classes", ())
-    def test_module_not_available(self):
+@pytest.mark.parametrize(
+    "item",
+    [
+        int,
+        sum,
+        1234,
+        object(),
+        DataClassItem(),
+        "a string",
+        b"some bytes",
+        {"a": "dict"},
+        ["a", "list"],
+        ("a", "tuple"),
+        {"a", "set"},
+        ScrapySubclassedItem,
+        pytest.param(
+            AttrsItem() if AttrsItem else None,
+            marks=pytest.mark.skipif(not AttrsItem, reason="attrs module is not available"),
+        ),
+        pytest.param(
+            PydanticModel() if PydanticModel else None,
+            marks=pytest.mark.skipif(not PydanticModel, reason="pydantic module is not available"),
+        ),
+        pytest.param(
+            PydanticV1Model() if PydanticV1Model else None,
+            marks=pytest.mark.skipif(
+                not PydanticV1Model, reason="pydantic.v1 module is not available"
+            ),
+        ),
+    ],
+)
+def test_false(item):
+    assert not ScrapyItemAdapter.is_item(item)
+
+
+@_requires_scrapy
+@pytest.mark.parametrize("import_error", [True, False], ids=["import_error", "not_available"])
+def test_module_not_available(monkeypatch, import_error):
+    if import_error:
+        monkeypatch.setitem(sys.modules, "scrapy", None)
+        imports = clear_itemadapter_imports()
+    else:
+        monkeypatch.setattr("itemadapter.adapter._scrapy_item_classes", ())
+        imports = nullcontext()
+    with imports:
+        # pylint: disable-next=reimported,redefined-outer-name
         from itemadapter.adapter import ScrapyItemAdapter
 
-        self.assertFalse(ScrapyItemAdapter.is_item(ScrapySubclassedItem(name="asdf", value=1234)))
-        with self.assertRaises(TypeError, msg="ScrapySubclassedItem is not a valid item class"):
+        assert not ScrapyItemAdapter.is_item(ScrapySubclassedItem(name="asdf", value=1234))
+        with pytest.raises(TypeError, match=_NOT_VALID_ITEM_RE):
             get_field_meta_from_class(ScrapySubclassedItem, "name")
 
-    @unittest.skipIf(not ScrapySubclassedItem, "scrapy module is not available")
-    def test_true(self):
-        from itemadapter.adapter import ScrapyItemAdapter
 
-        self.assertTrue(ScrapyItemAdapter.is_item(ScrapyItem()))
-        self.assertTrue(ScrapyItemAdapter.is_item(ScrapySubclassedItem()))
-        self.assertTrue(ScrapyItemAdapter.is_item(ScrapySubclassedItem(name="asdf", value=1234)))
-        # field metadata
-        self.assertEqual(
-            get_field_meta_from_class(ScrapySubclassedItem, "name"),
-            MappingProxyType({"serializer": str}),
-        )
-        self.assertEqual(
-            get_field_meta_from_class(ScrapySubclassedItem, "value"),
-            MappingProxyType({"serializer": int}),
-        )
-
-
-try:
-    import scrapy
-except ImportError:
-    scrapy = None
-
-
-class ScrapyDeprecatedBaseItemTestCase(unittest.TestCase):
-    """Tests for deprecated classes. These will go away once the upstream classes are removed."""
-
-    @unittest.skipIf(
-        scrapy is None or not hasattr(scrapy.item, "_BaseItem"),
-        "scrapy.item._BaseItem not available",
-    )
-    def test_deprecated_underscore_baseitem(self):
-        from itemadapter.adapter import ScrapyItemAdapter
+@_requires_scrapy
+@pytest.mark.parametrize(
+    "item",
+    [
+        pytest.param(ScrapyItem() if ScrapyItem else None, id="item"),
+        pytest.param(ScrapySubclassedItem() if ScrapySubclassedItem else None, id="subclassed"),
+        pytest.param(
+            ScrapySubclassedItem(name="asdf", value=1234) if ScrapySubclassedItem else None,
+            id="subclassed_populated",
+        ),
+    ],
+)
+def test_true(item):
+    assert ScrapyItemAdapter.is_item(item)
 
-        class SubClassed_BaseItem(scrapy.item._BaseItem):
-            pass
 
-        self.assertTrue(ScrapyItemAdapter.is_item(scrapy.item._BaseItem()))
-        self.assertTrue(ScrapyItemAdapter.is_item(SubClassed_BaseItem()))
+@_requires_scrapy
+@pytest.mark.parametrize(
+    ("field_name", "expected"),
+    [("name", _NAME_META), ("value", _VALUE_META)],
+)
+def test_field_meta(field_name, expected):
+    assert get_field_meta_from_class(ScrapySubclassedItem, field_name) == expected
 
-    @unittest.skipIf(
-        scrapy is None or not hasattr(scrapy.item, "BaseItem"),
-        "scrapy.item.BaseItem not available",
-    )
-    def test_deprecated_baseitem(self):
-        from itemadapter.adapter import ScrapyItemAdapter
 
-        class SubClassedBaseItem(scrapy.item.BaseItem):
-            pass
+# Tests for deprecated classes. These will go away once the upstream classes are removed.
 
-        self.assertTrue(ScrapyItemAdapter.is_item(scrapy.item.BaseItem()))
-        self.assertTrue(ScrapyItemAdapter.is_item(SubClassedBaseItem()))
 
-    @unittest.skipIf(scrapy is None, "scrapy module is not available")
-    def test_removed_baseitem(self):
-        """Mock the scrapy.item module so it does not contain the deprecated _BaseItem class."""
-        from itemadapter.adapter import ScrapyItemAdapter
+@pytest.mark.skipif(
+    scrapy is None or not hasattr(scrapy.item, "_BaseItem"),
+    reason="scrapy.item._BaseItem not available",
+)
+def test_deprecated_underscore_baseitem():
+    class SubClassed_BaseItem(scrapy.item._BaseItem):
+        pass
+
+    assert ScrapyItemAdapter.is_item(scrapy.item._BaseItem())
+    assert ScrapyItemAdapter.is_item(SubClassed_BaseItem())
+
+
+@pytest.mark.skipif(
+    scrapy is None or not hasattr(scrapy.item, "BaseItem"),
+    reason="scrapy.item.BaseItem not available",
+)
+def test_deprecated_baseitem():
+    class SubClassedBaseItem(scrapy.item.BaseItem):
+        pass
+
+    assert ScrapyItemAdapter.is_item(scrapy.item.BaseItem())
+    assert ScrapyItemAdapter.is_item(SubClassedBaseItem())
+
+
+@_requires_scrapy
+def test_removed_baseitem(monkeypatch):
+    """Mock the scrapy.item module so it does not contain the deprecated _BaseItem class."""
+
+    class MockItemModule:
+        Item = ScrapyItem
 
-        class MockItemModule:
-            Item = ScrapyItem
-
-        with mock.patch("scrapy.item", MockItemModule):
-            self.assertFalse(ScrapyItemAdapter.is_item({}))
-            self.assertEqual(
-                get_field_meta_from_class(ScrapySubclassedItem, "name"),
-                MappingProxyType({"serializer": str}),
-            )
-            self.assertEqual(
-                get_field_meta_from_class(ScrapySubclassedItem, "value"),
-                MappingProxyType({"serializer": int}),
-            )
+    monkeypatch.setattr("scrapy.item", MockItemModule)
+    assert not ScrapyItemAdapter.is_item({})
+    assert get_field_meta_from_class(ScrapySubclassedItem, "name") == _NAME_META
+    assert get_field_meta_from_class(ScrapySubclassedItem, "value") == _VALUE_META
@@ -1,36 +1,35 @@
 from __future__ import annotations
 
-import unittest
 from collections.abc import Iterator, KeysView
 from types import MappingProxyType
 from typing import Any
-from unittest import mock
 
-from itemadapter.adapter import AdapterInterface, ItemAdapter
+import pytest
 
+from itemadapter.adapter import AdapterInterface, ItemAdapter
 
-class AdapterInterfaceTest(unittest.TestCase):
-    @mock.patch.multiple(AdapterInterface, __abstractmethods__=set())
-    def test_interface_class_methods(self):
-        with self.assertRaises(NotImplementedError):
-            AdapterInterface.is_item(object())
-        with self.assertRaises(NotImplementedError):
-            AdapterInterface.is_item_class(object)
+_EMPTY_META = MappingProxyType({})
 
 
 class FakeItemClass:
-    _fields = {
-        "name": {"serializer": str},
-        "value": {"serializer": int},
-    }
+    __slots__ = ("_values",)
+
+    _fields = MappingProxyType(
+        {
+            "name": MappingProxyType({"serializer": str}),
+            "value": MappingProxyType({"serializer": int}),
+        }
+    )
 
     def __init__(self, **kwargs) -> None:
-        self._values = {**kwargs}
+        self._values = dict(kwargs)
 
 
 class BaseFakeItemAdapter(AdapterInterface):
     """An adapter that only implements the required methods."""
 
+    __slots__ = ("item",)
+
     @classmethod
     def is_item_class(cls, item_class: type) -> bool:
         return issubclass(item_class, FakeItemClass)
@@ -62,158 +61,169 @@ class BaseFakeItemAdapter(AdapterInterface):
 class FieldNamesFakeItemAdapter(BaseFakeItemAdapter):
     """An adapter that also implements the field_names method."""
 
+    __slots__ = ()
+
     def field_names(self) -> KeysView:
-        return KeysView({key.upper(): value for key, value in self.item._fields.items()})
+        return dict.fromkeys(key.upper() for key in self.item._fields).keys()
 
 
 class MetadataFakeItemAdapter(BaseFakeItemAdapter):
     """An adapter that also implements metadata-related methods."""
 
+    __slots__ = ()
+
     @classmethod
     def get_field_meta_from_class(cls, item_class: type, field_name: str) -> MappingProxyType:
-        return MappingProxyType(item_class._fields.get(field_name) or {})
-
-
-class BaseFakeItemAdapterTest(unittest.TestCase):
-    item_class = FakeItemClass
-    adapter_class = BaseFakeItemAdapter
-
-    def setUp(self):
-        ItemAdapter.ADAPTER_CLASSES.appendleft(self.adapter_class)
-
-    def tearDown(self):
-        ItemAdapter.ADAPTER_CLASSES.popleft()
-
-    def test_repr(self):
-        item = self.item_class()
-        adapter = ItemAdapter(item)
-        self.assertEqual(repr(adapter), "<ItemAdapter for FakeItemClass()>")
-        adapter["name"] = "asdf"
-        adapter["value"] = 1234
-        self.assertEqual(repr(adapter), "<ItemAdapter for FakeItemClass(name='asdf', value=1234)>")
-
-    def test_get_set_value(self):
-        item = self.item_class()
-        adapter = ItemAdapter(item)
-        self.assertEqual(adapter.get("name"), None)
-        self.assertEqual(adapter.get("value"), None)
-        adapter["name"] = "asdf"
-        adapter["value"] = 1234
-        self.assertEqual(adapter.get("name"), "asdf")
-        self.assertEqual(adapter.get("value"), 1234)
-        self.assertEqual(adapter["name"], "asdf")
-        self.assertEqual(adapter["value"], 1234)
-
-    def test_get_set_value_init(self):
-        item = self.item_class(name="asdf", value=1234)
-        adapter = ItemAdapter(item)
-        self.assertEqual(adapter.get("name"), "asdf")
-        self.assertEqual(adapter.get("value"), 1234)
-        self.assertEqual(adapter["name"], "asdf")
-        self.assertEqual(adapter["value"], 1234)
-
-    def test_get_value_keyerror(self):
-        item = self.item_class()
-        adapter = ItemAdapter(item)
-        with self.assertRaises(KeyError):
-            adapter["_undefined_"]
-
-    def test_as_dict(self):
-        item = self.item_class(name="asdf", value=1234)
-        adapter = ItemAdapter(item)
-        self.assertEqual({"name": "asdf", "value": 1234}, dict(adapter))
-
-    def test_set_value_keyerror(self):
-        item = self.item_class()
-        adapter = ItemAdapter(item)
-        with self.assertRaises(KeyError):
-            adapter["_undefined_"] = "some value"
-
-    def test_delitem_len_iter(self):
-        item = self.item_class(name="asdf", value=1234)
-        adapter = ItemAdapter(item)
-        self.assertEqual(len(adapter), 2)
-        self.assertEqual(sorted(list(iter(adapter))), ["name", "value"])
-
-        del adapter["name"]
-        self.assertEqual(len(adapter), 1)
-        self.assertEqual(sorted(list(iter(adapter))), ["value"])
-
-        del adapter["value"]
-        self.assertEqual(len(adapter), 0)
-        self.assertEqual(sorted(list(iter(adapter))), [])
-
-        with self.assertRaises(KeyError):
-            del adapter["name"]
-        with self.assertRaises(KeyError):
-            del adapter["value"]
-        with self.assertRaises(KeyError):
-            del adapter["_undefined_"]
-
-    def test_get_value_keyerror_item_dict(self):
-        """Instantiate without default values."""
-        adapter = ItemAdapter(self.item_class())
-        with self.assertRaises(KeyError):
-            adapter["name"]
-
-    def test_get_field_meta(self):
-        """Metadata is always empty for the default implementation."""
-        adapter = ItemAdapter(self.item_class())
-        self.assertEqual(adapter.get_field_meta("_undefined_"), MappingProxyType({}))
-        self.assertEqual(adapter.get_field_meta("name"), MappingProxyType({}))
-        self.assertEqual(adapter.get_field_meta("value"), MappingProxyType({}))
-
-    def test_get_field_meta_from_class(self):
-        """Metadata is always empty for the default implementation."""
-        self.assertEqual(
-            ItemAdapter.get_field_meta_from_class(self.item_class, "_undefined_"),
-            MappingProxyType({}),
-        )
-        self.assertEqual(
-            ItemAdapter.get_field_meta_from_class(self.item_class, "name"), MappingProxyType({})
-        )
-        self.assertEqual(
-            ItemAdapter.get_field_meta_from_class(self.item_class, "value"), MappingProxyType({})
-        )
-
-    def test_field_names(self):
-        item = self.item_class(name="asdf", value=1234)
-        adapter = ItemAdapter(item)
-        self.assertIsInstance(adapter.field_names(), KeysView)
-        self.assertEqual(sorted(adapter.field_names()), ["name", "value"])
-
-
-class MetadataFakeItemAdapterTest(BaseFakeItemAdapterTest):
-    item_class = FakeItemClass
-    adapter_class = MetadataFakeItemAdapter
-
-    def test_get_field_meta(self):
-        adapter = ItemAdapter(self.item_class())
-        self.assertEqual(adapter.get_field_meta("_undefined_"), MappingProxyType({}))
-        self.assertEqual(adapter.get_field_meta("name"), MappingProxyType({"serializer": str}))
-        self.assertEqual(adapter.get_field_meta("value"), MappingProxyType({"serializer": int}))
-
-    def test_get_field_meta_from_class(self):
-        self.assertEqual(
-            ItemAdapter.get_field_meta_from_class(self.item_class, "_undefined_"),
-            MappingProxyType({}),
-        )
-        self.assertEqual(
-            ItemAdapter.get_field_meta_from_class(self.item_class, "name"),
-            MappingProxyType({"serializer": str}),
-        )
-        self.assertEqual(
-            ItemAdapter.get_field_meta_from_class(self.item_class, "value"),
-            MappingProxyType({"serializer": int}),
-        )
-
-
-class FieldNamesFakeItemAdapterTest(BaseFakeItemAdapterTest):
-    item_class = FakeItemClass
-    adapter_class = FieldNamesFakeItemAdapter
-
-    def test_field_names(self):
-        item = self.item_class(name="asdf", value=1234)
-        adapter = ItemAdapter(item)
-        self.assertIsInstance(adapter.field_names(), KeysView)
-        self.assertEqual(sorted(adapter.field_names()), ["NAME", "VALUE"])
+        return item_class._fields.get(field_name, _EMPTY_META)
+
+
+def test_interface_class_methods(monkeypatch):
+    monkeypatch.setattr(AdapterInterface, "__abstractmethods__", set())
+    with pytest.raises(NotImplementedError):
+        AdapterInterface.is_item(object())
+    with pytest.raises(NotImplementedError):
+        AdapterInterface.is_item_class(object)
+
+
+def test_interface_slotted_mixin():
+    """Custom adapters can combine AdapterInterface with other slotted base classes."""
+
+    class SlottedMixin:
+        __slots__ = ("extra",)
+
+    class SlottedMixinAdapter(SlottedMixin, AdapterInterface):
+        @classmethod
+        def is_item_class(cls, item_class: type) -> bool:
+            return issubclass(item_class, FakeItemClass)
+
+        def __getitem__(self, field_name: str) -> Any:
+            return self.item._values[field_name]
+
+        def __setitem__(self, field_name: str, value: Any) -> None:
+            self.item._values[field_name] = value
+
+        def __delitem__(self, field_name: str) -> None:
+            del self.item._values[field_name]
+
+        def __iter__(self) -> Iterator:
+            return iter(self.item._values)
+
+        def __len__(self) -> int:
+            return len(self.item._values)
+
+    adapter = SlottedMixinAdapter(FakeItemClass(name="asdf"))
+    adapter.extra = "extra"
+    assert dict(adapter) == {"name": "asdf"}
+    assert adapter.extra == "extra"
+
+
+@pytest.fixture(
+    scope="module",
+    name="adapter_class",
+    params=[BaseFakeItemAdapter, MetadataFakeItemAdapter, FieldNamesFakeItemAdapter],
+    ids=lambda adapter_class: adapter_class.__name__,
+)
+def adapter_class_fixture(request):
+    ItemAdapter.ADAPTER_CLASSES.appendleft(request.param)
+    yield request.param
+    ItemAdapter.ADAPTER_CLASSES.popleft()
+
+
+# field metadata reported by MetadataFakeItemAdapter; the other adapters report none
+_FIELD_META_CASES = [
+    pytest.param("_undefined_", _EMPTY_META, id="undefined"),
+    pytest.param("name", MappingProxyType({"serializer": str}), id="name"),
+    pytest.param("value", MappingProxyType({"serializer": int}), id="value"),
+]
+
+
+def test_repr(adapter_class):
+    adapter = ItemAdapter(FakeItemClass())
+    assert repr(adapter) == "<ItemAdapter for FakeItemClass()>"
+    adapter["name"] = "asdf"
+    adapter["value"] = 1234
+    assert repr(adapter) == "<ItemAdapter for FakeItemClass(name='asdf', value=1234)>"
+
+
+def test_get_set_value(adapter_class):
+    adapter = ItemAdapter(FakeItemClass())
+    assert adapter.get("name") is None
+    assert adapter.get("value") is None
+    adapter["name"] = "asdf"
+    adapter["value"] = 1234
+    assert adapter.get("name") == "asdf"
+    assert adapter.get("value") == 1234
+    assert adapter["name"] == "asdf"
+    assert adapter["value"] == 1234
+
+
+def test_get_set_value_init(adapter_class):
+    adapter = ItemAdapter(FakeItemClass(name="asdf", value=1234))
+    assert adapter.get("name") == "asdf"
+    assert adapter.get("value") == 1234
+    assert adapter["name"] == "asdf"
+    assert adapter["value"] == 1234
+
+
+@pytest.mark.parametrize("field_name", ["_undefined_", "name"], ids=["undefined", "unset"])
+def test_get_value_keyerror(adapter_class, field_name):
+    """Undefined fields and defined fields without a value both raise KeyError."""
+    adapter = ItemAdapter(FakeItemClass())
+    with pytest.raises(KeyError):
+        adapter[field_name]
+
+
+def test_as_dict(adapter_class):
+    adapter = ItemAdapter(FakeItemClass(name="asdf", value=1234))
+    assert dict(adapter) == {"name": "asdf", "value": 1234}
+
+
+def test_set_value_keyerror(adapter_class):
+    adapter = ItemAdapter(FakeItemClass())
+    with pytest.raises(KeyError):
+        adapter["_undefined_"] = "some value"
+
+
+def test_delitem_len_iter(adapter_class):
+    adapter = ItemAdapter(FakeItemClass(name="asdf", value=1234))
+    assert len(adapter) == 2
+    assert sorted(adapter) == ["name", "value"]
+
+    del adapter["name"]
+    assert len(adapter) == 1
+    assert sorted(adapter) == ["value"]
+
+    del adapter["value"]
+    assert len(adapter) == 0
+    assert sorted(adapter) == []
+
+
+@pytest.mark.parametrize("field_name", ["name", "value", "_undefined_"])
+def test_delitem_keyerror(adapter_class, field_name):
+    adapter = ItemAdapter(FakeItemClass(name="asdf", value=1234))
+    del adapter["name"]
+    del adapter["value"]
+    with pytest.raises(KeyError):
+        del adapter[field_name]
+
+
+@pytest.mark.parametrize(("field_name", "metadata"), _FIELD_META_CASES)
+def test_get_field_meta(adapter_class, field_name, metadata):
+    adapter = ItemAdapter(FakeItemClass())
+    expected = metadata if adapter_class is MetadataFakeItemAdapter else _EMPTY_META
+    assert adapter.get_field_meta(field_name) == expected
+
+
+@pytest.mark.parametrize(("field_name", "metadata"), _FIELD_META_CASES)
+def test_get_field_meta_from_class(adapter_class, field_name, metadata):
+    expected = metadata if adapter_class is MetadataFakeItemAdapter else _EMPTY_META
+    assert ItemAdapter.get_field_meta_from_class(FakeItemClass, field_name) == expected
+
+
+def test_field_names(adapter_class):
+    adapter = ItemAdapter(FakeItemClass(name="asdf", value=1234))
+    expected = (
+        ["NAME", "VALUE"] if adapter_class is FieldNamesFakeItemAdapter else ["name", "value"]
+    )
+    assert isinstance(adapter.field_names(), KeysView)
+    assert sorted(adapter.field_names()) == expected